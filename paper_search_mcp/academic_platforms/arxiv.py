@@ -22,6 +22,10 @@ class ArxivSearcher(PaperSource):
     """Searcher for arXiv papers"""
     BASE_URL = "http://export.arxiv.org/api/query"
 
+    def __init__(self):
+        # Reuse connections across searches and downloads
+        self.session = requests.Session()
+
     def search(self, query: str, max_results: int = 10,
                date_from: str = None, date_to: str = None) -> List[Paper]:
         """Search arXiv papers.
@@ -51,7 +55,7 @@ class ArxivSearcher(PaperSource):
             'sortBy': 'submittedDate',
             'sortOrder': 'descending'
         }
-        response = requests.get(self.BASE_URL, params=params)
+        response = self.session.get(self.BASE_URL, params=params)
         feed = feedparser.parse(response.content)
         papers = []
         for entry in feed.entries:
@@ -80,7 +84,7 @@ class ArxivSearcher(PaperSource):
 
     def download_pdf(self, paper_id: str, save_path: str) -> str:
         pdf_url = f"https://arxiv.org/pdf/{paper_id}.pdf"
-        response = requests.get(pdf_url)
+        response = self.session.get(pdf_url)
         os.makedirs(save_path, exist_ok=True)
         output_file = f"{save_path}/{paper_id}.pdf"
         with open(output_file, 'wb') as f:
@@ -1,14 +1,35 @@
 from typing import List, Optional
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import re
+import threading
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
 import time
 import random
-from ..paper import Paper
+from ..paper import Paper, dedupe_papers
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Patterns used while parsing every result link
+_CLUSTER_RE = re.compile(r'(?:cluster|cites)=(\d+)')
+_CITED_RE = re.compile(r'Cited by (\d+)')
+_AUTHORS_RE = re.compile(r'\s*,\s*')
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+
+
+def _find_first(elem, tag: str, class_name: str):
+    """Return the first <tag> at or below elem carrying class_name, or None"""
+    for match in elem.find_class(class_name):
+        if match.tag == tag:
+            return match
+    return None
+
+
 class PaperSource:
     """Abstract base class for paper sources"""
     def search(self, query: str, **kwargs) -> List[Paper]:
@@ -30,9 +51,18 @@ class GoogleScholarSearcher(PaperSource):
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)",
         "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36"
     ]
+    RESULTS_PER_PAGE = 10
+    # Upper bound on result pages requested in parallel
+    MAX_CONCURRENT_PAGES = 3
+    # Random gap in seconds between the starts of consecutive requests
+    MIN_REQUEST_DELAY = 1.0
+    MAX_REQUEST_DELAY = 3.0
 
     def __init__(self):
         self._setup_session()
+        # Shared by the page workers so requests start spaced out, not in a burst
+        self._request_lock = threading.Lock()
+        self._last_request = 0.0
 
     def _setup_session(self):
         """Initialize session with random user agent"""
@@ -40,44 +70,61 @@ class GoogleScholarSearcher(PaperSource):
         self.session.headers.update({
             'User-Agent': random.choice(self.BROWSERS),
             'Accept': 'text/html,application/xhtml+xml',
-            'Accept-Language': 'en-US,en;q=0.9'
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Connection': 'keep-alive'
         })
 
+        # Keep connections alive across pages and back off on throttling
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+
     def _extract_year(self, text: str) -> Optional[int]:
         """Extract year from publication info"""
-        for word in text.split():
-            if word.isdigit() and 1900 <= int(word) <= datetime.now().year:
-                return int(word)
+        # The year follows the venue, so take the last plausible match rather
+        # than one inside a volume or page range
+        current_year = datetime.now().year
+        for match in reversed(_YEAR_RE.findall(text)):
+            year = int(match)
+            if year <= current_year:
+                return year
         return None
 
     def _extract_cluster_id(self, item) -> Optional[str]:
         """Extract Google Scholar cluster ID from result item"""
-        import re
         # Look for cluster/cites ID in the links (gs_fl div contains "Cited by", "All versions", etc.)
-        links_div = item.find('div', class_='gs_fl')
-        if links_div:
-            for a in links_div.find_all('a', href=True):
-                href = a['href']
+        links_div = _find_first(item, 'div', 'gs_fl')
+        if links_div is not None:
+            for a in links_div.xpath('.//a[@href]'):
+                href = a.get('href')
                 # Match cluster=ID or cites=ID
-                match = re.search(r'(?:cluster|cites)=(\d+)', href)
+                match = _CLUSTER_RE.search(href)
                 if match:
                     return match.group(1)
 
         # Also check data-cid attribute on the result container
-        if item.get('data-cid'):
-            return item['data-cid']
+        cid = item.get('data-cid')
+        if cid:
+            return cid
 
         return None
 
     def _extract_citations(self, item) -> int:
         """Extract citation count from result item"""
-        import re
-        links_div = item.find('div', class_='gs_fl')
-        if links_div:
-            for a in links_div.find_all('a'):
-                text = a.get_text()
-                if 'Cited by' in text:
-                    match = re.search(r'Cited by (\d+)', text)
+        links_div = _find_first(item, 'div', 'gs_fl')
+        if links_div is not None:
+            for a in links_div.iter('a'):
+                text = a.text_content()
+                if text.startswith('Cited by'):
+                    match = _CITED_RE.match(text)
                     if match:
                         return int(match.group(1))
         return 0
@@ -86,29 +133,36 @@ class GoogleScholarSearcher(PaperSource):
         """Parse single paper entry from HTML"""
         try:
             # Extract main paper elements
-            title_elem = item.find('h3', class_='gs_rt')
-            info_elem = item.find('div', class_='gs_a')
-            abstract_elem = item.find('div', class_='gs_rs')
+            title_elem = _find_first(item, 'h3', 'gs_rt')
+            info_elem = _find_first(item, 'div', 'gs_a')
+            abstract_elem = _find_first(item, 'div', 'gs_rs')
 
-            if not title_elem or not info_elem:
+            if title_elem is None or info_elem is None:
                 return None
 
             # Process title and URL
-            title = title_elem.get_text(strip=True).replace('[PDF]', '').replace('[HTML]', '')
-            link = title_elem.find('a', href=True)
-            url = link['href'] if link else ''
+            title = ''.join(text.strip() for text in title_elem.itertext()).replace('[PDF]', '').replace('[HTML]', '')
+            links = title_elem.xpath('.//a[@href]')
+            url = links[0].get('href') if links else ''
+
+            info_text = info_elem.text_content()
 
             # Extract cluster ID (Google Scholar's unique paper identifier)
             cluster_id = self._extract_cluster_id(item)
 
-            # Fallback to URL hash if no cluster ID found
-            paper_id = cluster_id if cluster_id else f"gs_{abs(hash(url))}"
+            # Fallback to a stable digest of the URL, or of the title and byline
+            # for link-less entries such as [CITATION] results
+            if cluster_id:
+                paper_id = cluster_id
+            else:
+                fallback_key = url or f"{title}\n{info_text}"
+                paper_id = f"gs_{hashlib.blake2b(fallback_key.encode('utf-8'), digest_size=8).hexdigest()}"
 
             # Note: DOI not available in GS search results (would require extra requests)
 
             # Process author info
-            info_text = info_elem.get_text()
-            authors = [a.strip() for a in info_text.split('-')[0].split(',')]
+            authors_part, _, _ = info_text.partition('-')
+            authors = _AUTHORS_RE.split(authors_part.strip())
             year = self._extract_year(info_text)
 
             # Extract citation count
@@ -119,7 +173,7 @@ class GoogleScholarSearcher(PaperSource):
                 paper_id=paper_id,
                 title=title,
                 authors=authors,
-                abstract=abstract_elem.get_text() if abstract_elem else "",
+                abstract=abstract_elem.text_content() if abstract_elem is not None else "",
                 url=url,
                 pdf_url="",
                 published_date=datetime(year, 1, 1) if year else None,
@@ -134,76 +188,105 @@ class GoogleScholarSearcher(PaperSource):
             logger.warning(f"Failed to parse paper: {e}")
             return None
 
+    def _build_params(self, query: str, date_from: str = None, date_to: str = None) -> dict:
+        """Build the query parameters shared by every result page"""
+        params = {
+            'q': query,
+            'hl': 'en',
+            'as_sdt': '0,5'  # Include articles and citations
+        }
+
+        # Add year filters if provided (extract year from YYYY-MM-DD format)
+        if date_from:
+            try:
+                year_from = int(date_from.split('-')[0])
+                params['as_ylo'] = year_from
+            except (ValueError, IndexError):
+                logger.warning(f"Invalid date_from format: {date_from}")
+
+        if date_to:
+            try:
+                year_to = int(date_to.split('-')[0])
+                params['as_yhi'] = year_to
+            except (ValueError, IndexError):
+                logger.warning(f"Invalid date_to format: {date_to}")
+
+        return params
+
+    def _wait_for_request_slot(self) -> None:
+        """Block until a random delay has passed since the previous request started"""
+        with self._request_lock:
+            delay = random.uniform(self.MIN_REQUEST_DELAY, self.MAX_REQUEST_DELAY)
+            wait = self._last_request + delay - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_request = time.monotonic()
+
+    def _fetch_page(self, params: dict, start: int) -> Optional[str]:
+        """Fetch a single result page, returning its HTML or None on failure"""
+        try:
+            # Space request starts out; responses may still overlap
+            self._wait_for_request_slot()
+            response = self.session.get(self.SCHOLAR_URL, params={**params, 'start': start})
+
+            if response.status_code != 200:
+                logger.error(f"Search failed with status {response.status_code}")
+                return None
+
+            return response.text
+        except Exception as e:
+            logger.error(f"Search error: {e}")
+            return None
+
+    def _parse_page(self, html: str) -> Optional[List[Paper]]:
+        """Parse one result page, returning None if it holds no results"""
+        try:
+            results = [div for div in lxml.html.document_fromstring(html).find_class('gs_ri') if div.tag == 'div']
+        except Exception as e:
+            logger.error(f"Search error: {e}")
+            return None
+
+        if not results:
+            return None
+
+        return [paper for paper in map(self._parse_paper, results) if paper]
+
+    def _fetch_and_parse_page(self, params: dict, start: int) -> Optional[List[Paper]]:
+        """Fetch and parse one result page inside a worker thread"""
+        html = self._fetch_page(params, start)
+        return self._parse_page(html) if html is not None else None
+
     def search(self, query: str, max_results: int = 10, date_from: str = None, date_to: str = None) -> List[Paper]:
         """
         Search Google Scholar with custom parameters
 
+        Result pages are fetched and parsed concurrently (at most
+        MAX_CONCURRENT_PAGES in flight, with request starts spaced by a random
+        1-3 s delay) and then combined in page order.
+
         Args:
             query: Search query string
             max_results: Maximum number of papers to return
             date_from: Start date in YYYY-MM-DD format (only year is used)
             date_to: End date in YYYY-MM-DD format (only year is used)
         """
-        papers = []
-        start = 0
-        results_per_page = min(10, max_results)
+        params = self._build_params(query, date_from, date_to)
+        starts = range(0, max_results, self.RESULTS_PER_PAGE)
+        if not starts:
+            return []
 
-        while len(papers) < max_results:
-            try:
-                # Construct search parameters
-                params = {
-                    'q': query,
-                    'start': start,
-                    'hl': 'en',
-                    'as_sdt': '0,5'  # Include articles and citations
-                }
-
-                # Add year filters if provided (extract year from YYYY-MM-DD format)
-                if date_from:
-                    try:
-                        year_from = int(date_from.split('-')[0])
-                        params['as_ylo'] = year_from
-                    except (ValueError, IndexError):
-                        logger.warning(f"Invalid date_from format: {date_from}")
-
-                if date_to:
-                    try:
-                        year_to = int(date_to.split('-')[0])
-                        params['as_yhi'] = year_to
-                    except (ValueError, IndexError):
-                        logger.warning(f"Invalid date_to format: {date_to}")
-
-                # Make request with random delay
-                time.sleep(random.uniform(1.0, 3.0))
-                response = self.session.get(self.SCHOLAR_URL, params=params)
-                
-                if response.status_code != 200:
-                    logger.error(f"Search failed with status {response.status_code}")
-                    break
-
-                # Parse results
-                soup = BeautifulSoup(response.text, 'html.parser')
-                results = soup.find_all('div', class_='gs_ri')
-
-                if not results:
-                    break
-
-                # Process each result
-                for item in results:
-                    if len(papers) >= max_results:
-                        break
-                        
-                    paper = self._parse_paper(item)
-                    if paper:
-                        papers.append(paper)
-
-                start += results_per_page
-
-            except Exception as e:
-                logger.error(f"Search error: {e}")
+        with ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENT_PAGES, len(starts))) as executor:
+            pages = list(executor.map(lambda start: self._fetch_and_parse_page(params, start), starts))
+
+        papers = []
+        for page_papers in pages:
+            # Stop at the first failed or empty page, as sequential paging would
+            if page_papers is None:
                 break
+            papers.extend(page_papers)
 
-        return papers[:max_results]
+        # Pages requested concurrently can overlap if the ranking shifts between them
+        return dedupe_papers(papers)[:max_results]
 
     def download_pdf(self, paper_id: str, save_path: str) -> str:
         """
@@ -1,13 +1,34 @@
 # paper_search_mcp/academic_platforms/openalex.py
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
 from datetime import datetime
+from functools import lru_cache, partial
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
+import os
+import time
+from uuid import uuid4
 from ..paper import Paper
+from ..pdf_utils import extract_text_from_pdf
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 logger = logging.getLogger(__name__)
 
 
+class _WorkNotFound(Exception):
+    """Raised for a 404 inside the work cache so misses are never cached"""
+
+
 class OpenAlexSearcher:
     """Searcher for OpenAlex - a fully open index of scholarly works.
 
@@ -20,13 +41,44 @@ class OpenAlexSearcher:
     # Polite pool email for faster rate limits
     USER_EMAIL = "paper-search-mcp@example.org"
 
-    def __init__(self):
+    # Number of raw work records kept for repeated ID/DOI lookups, and for how
+    # long (same lifetime as the server's result cache)
+    WORK_CACHE_SIZE = 1024
+    WORK_CACHE_TTL = 300  # seconds
+
+    def __init__(self, stream_results: bool = False):
+        """Set up a pooled, retrying session.
+
+        Args:
+            stream_results: Parse list responses incrementally with ijson (if
+                installed) instead of decoding each body in one go. Slower for
+                normal page sizes; only worth it when memory is tight.
+        """
+        self.stream_results = stream_results and ijson is not None
+
         self.session = requests.Session()
         self.session.headers.update({
             'Accept': 'application/json',
-            'User-Agent': f'paper-search-mcp/0.1 (mailto:{self.USER_EMAIL})'
+            'User-Agent': f'paper-search-mcp/0.1 (mailto:{self.USER_EMAIL})',
+            'Connection': 'keep-alive'
         })
 
+        # Reuse connections across calls and retry rate-limited/5xx responses
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+
+        # Cached per instance so the key is just the work reference and TTL window
+        self._fetch_work_cached = lru_cache(maxsize=self.WORK_CACHE_SIZE)(self._fetch_work_uncached)
+
     def search(
         self,
         query: str,
@@ -61,12 +113,8 @@ class OpenAlexSearcher:
                 'select': 'id,title,authorships,abstract_inverted_index,doi,publication_date,open_access,primary_location,type,cited_by_count,topics'
             }
 
-            response = self.session.get(f'{self.BASE_URL}/works', params=params)
-            response.raise_for_status()
-            data = response.json()
-
             papers = []
-            for item in data.get('results', []):
+            for item in self._iter_works(params):
                 paper = self._parse_work(item)
                 if paper:
                     papers.append(paper)
@@ -80,68 +128,92 @@ class OpenAlexSearcher:
             logger.error(f"Unexpected error in OpenAlex search: {e}")
             return []
 
+    def _iter_works(self, params: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Yield raw work objects from a /works list request.
+
+        With stream_results the body is parsed incrementally, so works are
+        handed out while later ones are still being received.
+        """
+        with self.session.get(f'{self.BASE_URL}/works', params=params, stream=self.stream_results) as response:
+            response.raise_for_status()
+
+            if not self.stream_results:
+                yield from json_loads(response.content).get('results', [])
+                return
+
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, 'results.item', use_float=True)
+
     def _parse_work(self, item: Dict[str, Any]) -> Optional[Paper]:
         """Parse an OpenAlex work object into a Paper."""
         try:
+            # Bind the lookups used below once per work
+            get = item.get
+            open_access = get('open_access') or {}
+            primary_loc = get('primary_location') or {}
+
             # Extract OpenAlex ID (short form)
-            openalex_id = item.get('id', '').replace('https://openalex.org/', '')
+            openalex_id = (get('id') or '').replace('https://openalex.org/', '')
 
             # Extract DOI (remove URL prefix if present)
-            doi = item.get('doi', '') or ''
+            doi = get('doi') or ''
             if doi.startswith('https://doi.org/'):
                 doi = doi[16:]
 
             # Extract title
-            title = item.get('title', '') or ''
+            title = get('title') or ''
 
             # Extract authors from authorships
             authors = []
-            for authorship in item.get('authorships', []):
-                author = authorship.get('author', {})
-                name = author.get('display_name', '')
+            for authorship in get('authorships') or ():
+                name = (authorship.get('author') or {}).get('display_name')
                 if name:
                     authors.append(name)
 
-            # Reconstruct abstract from inverted index
-            abstract = self._reconstruct_abstract(item.get('abstract_inverted_index'))
+            # Abstract is rebuilt from the inverted index only when first read;
+            # works without one (often paywalled) get an empty abstract directly
+            inverted_index = get('abstract_inverted_index')
+            abstract_loader = partial(self._reconstruct_abstract, inverted_index) if inverted_index else None
 
             # Extract publication date
-            pub_date_str = item.get('publication_date', '')
+            pub_date_str = get('publication_date')
             published_date = None
             if pub_date_str:
+                # Fixed YYYY-MM-DD layout, so slice instead of using strptime
                 try:
-                    published_date = datetime.strptime(pub_date_str, '%Y-%m-%d')
+                    published_date = datetime(int(pub_date_str[:4]), int(pub_date_str[5:7]), int(pub_date_str[8:10]))
                 except ValueError:
                     try:
-                        published_date = datetime.strptime(pub_date_str[:4], '%Y')
+                        published_date = datetime(int(pub_date_str[:4]), 1, 1)
                     except ValueError:
                         pass
 
             # Extract PDF URL from open_access or primary_location
             pdf_url = ''
-            open_access = item.get('open_access', {})
             if open_access.get('is_oa'):
-                pdf_url = open_access.get('oa_url', '')
+                pdf_url = open_access.get('oa_url') or ''
 
             if not pdf_url:
-                primary_loc = item.get('primary_location', {}) or {}
-                pdf_url = primary_loc.get('pdf_url', '') or ''
+                pdf_url = primary_loc.get('pdf_url') or ''
 
             # Extract categories from topics
             categories = []
-            for topic in item.get('topics', [])[:3]:  # Limit to top 3
-                if topic.get('display_name'):
-                    categories.append(topic['display_name'])
+            for topic in (get('topics') or ())[:3]:  # Limit to top 3
+                name = topic.get('display_name')
+                if name:
+                    categories.append(name)
 
             # Work type as category if no topics
-            if not categories and item.get('type'):
-                categories = [item['type']]
+            work_type = get('type')
+            if not categories and work_type:
+                categories = [work_type]
 
             return Paper(
                 paper_id=openalex_id,
                 title=title,
                 authors=authors,
-                abstract=abstract,
+                abstract=None if abstract_loader else '',
+                abstract_loader=abstract_loader,
                 doi=doi,
                 published_date=published_date,
                 pdf_url=pdf_url,
@@ -149,7 +221,7 @@ class OpenAlexSearcher:
                 source='openalex',
                 categories=categories,
                 keywords=[],
-                citations=item.get('cited_by_count', 0) or 0
+                citations=get('cited_by_count') or 0
             )
 
         except Exception as e:
@@ -162,18 +234,41 @@ class OpenAlexSearcher:
             return ''
 
         try:
-            # Build list of (position, word) tuples
-            words = []
+            # Positions index straight into the output, so no sort is needed
+            max_pos = max(pos for positions in inverted_index.values() for pos in positions)
+            words = [''] * (max_pos + 1)
             for word, positions in inverted_index.items():
                 for pos in positions:
-                    words.append((pos, word))
+                    words[pos] = word
 
-            # Sort by position and join
-            words.sort(key=lambda x: x[0])
-            return ' '.join(word for _, word in words)
+            # Skip gaps left by missing positions
+            return ' '.join(filter(None, words))
         except Exception:
             return ''
 
+    def _fetch_work(self, work_ref: str) -> Optional[Dict[str, Any]]:
+        """Fetch the raw work JSON for an OpenAlex ID or DOI URL, or None if it doesn't exist.
+
+        Successful lookups are reused for up to WORK_CACHE_TTL seconds.
+        """
+        try:
+            return self._fetch_work_cached(work_ref, int(time.monotonic() // self.WORK_CACHE_TTL))
+        except _WorkNotFound:
+            return None
+
+    def _fetch_work_uncached(self, work_ref: str, ttl_window: int) -> Dict[str, Any]:
+        """Fetch the raw work JSON; ttl_window only serves as part of the cache key.
+
+        404s and other HTTP errors raise, so only found works are cached.
+        """
+        response = self.session.get(f'{self.BASE_URL}/works/{work_ref}', params={'mailto': self.USER_EMAIL})
+
+        if response.status_code == 404:
+            raise _WorkNotFound(work_ref)
+
+        response.raise_for_status()
+        return json_loads(response.content)
+
     def get_work_by_doi(self, doi: str) -> Optional[Paper]:
         """Get a specific work by DOI.
 
@@ -192,16 +287,8 @@ class OpenAlexSearcher:
             elif doi.startswith('doi:'):
                 doi = doi[4:]
 
-            url = f'{self.BASE_URL}/works/https://doi.org/{doi}'
-            params = {'mailto': self.USER_EMAIL}
-
-            response = self.session.get(url, params=params)
-
-            if response.status_code == 404:
-                return None
-
-            response.raise_for_status()
-            return self._parse_work(response.json())
+            data = self._fetch_work(f'https://doi.org/{doi}')
+            return self._parse_work(data) if data else None
 
         except Exception as e:
             logger.error(f"Error fetching work by DOI {doi}: {e}")
@@ -221,16 +308,8 @@ class OpenAlexSearcher:
             if not openalex_id.startswith('W'):
                 openalex_id = f'W{openalex_id}'
 
-            url = f'{self.BASE_URL}/works/{openalex_id}'
-            params = {'mailto': self.USER_EMAIL}
-
-            response = self.session.get(url, params=params)
-
-            if response.status_code == 404:
-                return None
-
-            response.raise_for_status()
-            return self._parse_work(response.json())
+            data = self._fetch_work(openalex_id)
+            return self._parse_work(data) if data else None
 
         except Exception as e:
             logger.error(f"Error fetching OpenAlex work {openalex_id}: {e}")
@@ -256,14 +335,24 @@ class OpenAlexSearcher:
                 "Try accessing via DOI or publisher URL."
             )
 
-        import os
-        response = self.session.get(paper.pdf_url)
-        response.raise_for_status()
-
         os.makedirs(save_path, exist_ok=True)
         output_file = f"{save_path}/{paper_id}.pdf"
-        with open(output_file, 'wb') as f:
-            f.write(response.content)
+
+        # Stream to a uniquely named temporary file so a failed download never
+        # leaves a truncated PDF behind for read_paper to pick up, and
+        # concurrent downloads of the same work can't clobber each other.
+        # open() rather than tempfile keeps the usual umask-based permissions
+        partial_file = f"{output_file}.{uuid4().hex}.part"
+        try:
+            with open(partial_file, 'xb') as partial, \
+                    self.session.get(paper.pdf_url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    partial.write(chunk)
+            os.replace(partial_file, output_file)
+        finally:
+            if os.path.exists(partial_file):
+                os.remove(partial_file)
 
         return output_file
 
@@ -277,9 +366,6 @@ class OpenAlexSearcher:
         Returns:
             Extracted text content
         """
-        from ..pdf_utils import extract_text_from_pdf
-        import os
-
         try:
             pdf_path = f"{save_path}/{paper_id}.pdf"
             if not os.path.exists(pdf_path):
@@ -305,39 +391,21 @@ class OpenAlexSearcher:
             if not paper_id.startswith('W'):
                 paper_id = f'W{paper_id}'
 
-            # Get the work to extract referenced_works
-            url = f'{self.BASE_URL}/works/{paper_id}'
-            params = {'mailto': self.USER_EMAIL}
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            referenced_ids = data.get('referenced_works', [])
-            if not referenced_ids:
-                return []
-
-            # Extract IDs and fetch details
-            ref_ids = [r.replace('https://openalex.org/', '') for r in referenced_ids[:max_results]]
-
-            # Batch fetch referenced works
-            filter_str = '|'.join(ref_ids)
+            # cited_by:<id> selects the works this paper references in one request
             params = {
-                'filter': f'openalex:{filter_str}',
-                'per_page': max_results,
+                'filter': f'cited_by:{paper_id}',
+                'per_page': min(max_results, 200),
                 'sort': 'cited_by_count:desc',
                 'mailto': self.USER_EMAIL,
                 'select': 'id,title,authorships,abstract_inverted_index,doi,publication_date,open_access,primary_location,cited_by_count,topics'
             }
-            response = self.session.get(f'{self.BASE_URL}/works', params=params)
-            response.raise_for_status()
-
             papers = []
-            for item in response.json().get('results', []):
+            for item in self._iter_works(params):
                 paper = self._parse_work(item)
                 if paper:
                     papers.append(paper)
 
-            return papers
+            return papers[:max_results]
 
         except Exception as e:
             logger.error(f"Error fetching references for {paper_id}: {e}")
@@ -366,12 +434,8 @@ class OpenAlexSearcher:
                 'select': 'id,title,authorships,abstract_inverted_index,doi,publication_date,open_access,primary_location,cited_by_count,topics'
             }
 
-            response = self.session.get(f'{self.BASE_URL}/works', params=params)
-            response.raise_for_status()
-            data = response.json()
-
             papers = []
-            for item in data.get('results', []):
+            for item in self._iter_works(params):
                 paper = self._parse_work(item)
                 if paper:
                     papers.append(paper)
@@ -402,7 +466,7 @@ class OpenAlexSearcher:
 
             response = self.session.get(f'{self.BASE_URL}/authors', params=params)
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
 
             authors = []
             for a in data.get('results', []):
@@ -465,12 +529,8 @@ class OpenAlexSearcher:
                 'select': 'id,title,authorships,abstract_inverted_index,doi,publication_date,open_access,primary_location,cited_by_count,topics'
             }
 
-            response = self.session.get(f'{self.BASE_URL}/works', params=params)
-            response.raise_for_status()
-            data = response.json()
-
             papers = []
-            for item in data.get('results', []):
+            for item in self._iter_works(params):
                 paper = self._parse_work(item)
                 if paper:
                     papers.append(paper)
@@ -22,6 +22,10 @@ class PubMedSearcher(PaperSource):
     SEARCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
     FETCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
 
+    def __init__(self):
+        # esearch and efetch share a host, so keep the connection open between them
+        self.session = requests.Session()
+
     def search(self, query: str, max_results: int = 10,
                date_from: str = None, date_to: str = None) -> List[Paper]:
         """Search PubMed papers.
@@ -47,7 +51,7 @@ class PubMedSearcher(PaperSource):
                 search_params['mindate'] = date_from.replace('-', '/')
             if date_to:
                 search_params['maxdate'] = date_to.replace('-', '/')
-        search_response = requests.get(self.SEARCH_URL, params=search_params)
+        search_response = self.session.get(self.SEARCH_URL, params=search_params)
         search_root = ET.fromstring(search_response.content)
         ids = [id.text for id in search_root.findall('.//Id')]
         
@@ -56,7 +60,7 @@ class PubMedSearcher(PaperSource):
             'id': ','.join(ids),
             'retmode': 'xml'
         }
-        fetch_response = requests.get(self.FETCH_URL, params=fetch_params)
+        fetch_response = self.session.get(self.FETCH_URL, params=fetch_params)
         fetch_root = ET.fromstring(fetch_response.content)
         
         papers = []
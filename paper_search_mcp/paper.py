@@ -1,32 +1,54 @@
 # paper_search_mcp/paper.py
-from dataclasses import dataclass
+from array import array
+from dataclasses import InitVar, dataclass, field
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Any, Callable, Iterable, List, Dict, Optional
+import heapq
 
-@dataclass
+_json_dumps: Callable[[Any], bytes]
+try:
+    from orjson import dumps as _json_dumps
+except ImportError:
+    import json
+
+    def _stdlib_json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    _json_dumps = _stdlib_json_dumps
+
+
+# Not frozen: the deferred abstract is filled in after __init__, and
+# frozen+slots has a broken __setattr__ before 3.12
+@dataclass(slots=True)
 class Paper:
     """Standardized paper format with core fields for academic sources"""
     # 核心字段（必填，但允许空值或默认值）
     paper_id: str              # Unique identifier (e.g., arXiv ID, PMID, DOI)
     title: str                 # Paper title
     authors: List[str]         # List of author names
-    abstract: str              # Abstract text
+    abstract: Optional[str]    # Abstract text (None = built by abstract_loader)
     doi: str                   # Digital Object Identifier
-    published_date: datetime   # Publication date
+    published_date: Optional[datetime]  # Publication date
     pdf_url: str               # Direct PDF link
     url: str                   # URL to paper page
     source: str                # Source platform (e.g., 'arxiv', 'pubmed')
 
     # 可选字段
     updated_date: Optional[datetime] = None    # Last updated date
-    categories: List[str] = None               # Subject categories
-    keywords: List[str] = None                 # Keywords
-    citations: int = 0                         # Citation count
+    categories: Optional[List[str]] = None     # Subject categories
+    keywords: Optional[List[str]] = None       # Keywords
+    citations: Optional[int] = 0               # Citation count
     references: Optional[List[str]] = None     # List of reference IDs/DOIs
     extra: Optional[Dict] = None               # Source-specific extra metadata
+    # Private hook for sources that defer the abstract (abstract=None): builds
+    # it on first access. Init-only, so it is not a field and asdict() skips it
+    abstract_loader: InitVar[Optional[Callable[[], str]]] = field(default=None, kw_only=True)
 
-    def __post_init__(self):
+    def __post_init__(self, abstract_loader: Optional[Callable[[], str]]):
         """Post-initialization to handle default values"""
+        if abstract_loader is not None and _abstract_slot.__get__(self) is None:
+            # The 'abstract' slot holds the loader until the abstract is read
+            _abstract_slot.__set__(self, abstract_loader)
         if self.authors is None:
             self.authors = []
         if self.categories is None:
@@ -38,32 +60,113 @@ class Paper:
         if self.extra is None:
             self.extra = {}
 
+    def _get_abstract(self) -> str:
+        """Return the abstract, running the deferred loader at most once"""
+        value = _abstract_slot.__get__(self)
+        if not isinstance(value, str):
+            value = value() if value else ''
+            _abstract_slot.__set__(self, value)
+        return value
+
+    def _set_abstract(self, value: Optional[str]) -> None:
+        _abstract_slot.__set__(self, value)
+
     def to_dict(self, abstract_limit: int = 200) -> Dict:
         """Convert paper to dictionary format for serialization.
 
         Args:
             abstract_limit: Max chars for abstract. 0 = omit, -1 = full (default: 200)
         """
-        # Process abstract based on limit
-        if abstract_limit == 0:
-            abstract = None
-        elif abstract_limit > 0 and self.abstract and len(self.abstract) > abstract_limit:
-            abstract = self.abstract[:abstract_limit] + '...'
-        else:
+        # Only non-empty fields are added, so no second filtering pass is needed
+        result: Dict[str, Any] = {}
+        if self.paper_id:
+            result['id'] = self.paper_id
+        if self.source:
+            result['source'] = self.source
+        if self.title:
+            result['title'] = self.title
+        if self.authors:
+            result['authors'] = self.authors
+
+        # Process abstract based on limit (skipped entirely at 0 so an omitted
+        # abstract is never built by a deferred loader)
+        if abstract_limit != 0:
             abstract = self.abstract
+            if abstract:
+                if abstract_limit > 0 and len(abstract) > abstract_limit:
+                    abstract = f"{abstract[:abstract_limit]}..."
+                result['abstract'] = abstract
+
+        published = self.published_date
+        if isinstance(published, str):
+            # Already formatted by the source; pass it through unchanged
+            if published:
+                result['date'] = published
+        elif published:
+            result['date'] = published.strftime('%Y-%m-%d')
+        if self.doi:
+            result['doi'] = self.doi
+        if self.pdf_url:
+            result['pdf'] = self.pdf_url  # Include when available (e.g., open access)
+        if self.categories:
+            result['categories'] = self.categories
+        if self.citations:
+            result['citations'] = self.citations
+
+        return result
+
+    def to_json_bytes(self, abstract_limit: int = 200) -> bytes:
+        """Encode to_dict() output as compact UTF-8 JSON (orjson when installed)"""
+        return _json_dumps(self.to_dict(abstract_limit=abstract_limit))
+
+
+# Installed after @dataclass so 'abstract' stays a regular __init__ argument and
+# field; the property stores into the field's own slot, kept here for the accessors.
+# setattr because type checkers see 'abstract' as the declared str field
+_abstract_slot = Paper.__dict__['abstract']
+setattr(Paper, 'abstract', property(Paper._get_abstract, Paper._set_abstract))
+
+
+def dedupe_papers(papers: Iterable[Paper]) -> List[Paper]:
+    """Drop repeated papers, keeping the first occurrence of each.
+
+    Papers match on DOI (case-insensitive) when they have one, otherwise on
+    source and paper_id.
+    """
+    seen = set()
+    unique = []
+    for paper in papers:
+        key = paper.doi.lower() if paper.doi else (paper.source, paper.paper_id)
+        if key not in seen:
+            seen.add(key)
+            unique.append(paper)
+    return unique
+
+
+@dataclass
+class PaperBatch:
+    """Column-oriented view of a paper list for bulk ranking and filtering"""
+    papers: List[Paper]
+    titles: List[str]
+    dois: List[str]
+    citations: array           # Citation counts as a packed int64 column
+
+    @classmethod
+    def from_papers(cls, papers: Iterable[Paper]) -> 'PaperBatch':
+        """Build the columns once from a list of papers"""
+        papers = list(papers)
+        return cls(
+            papers=papers,
+            titles=[p.title for p in papers],
+            dois=[p.doi for p in papers],
+            citations=array('q', [p.citations or 0 for p in papers]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.papers)
 
-        result = {
-            'id': self.paper_id,
-            'source': self.source or None,
-            'title': self.title,
-            'authors': self.authors if self.authors else None,
-            'abstract': abstract,
-            'date': self.published_date.strftime('%Y-%m-%d') if self.published_date else None,
-            'doi': self.doi or None,
-            'pdf': self.pdf_url or None,  # Include when available (e.g., open access)
-            'categories': self.categories if self.categories else None,
-            'citations': self.citations if self.citations else None,
-        }
-
-        # Remove None/empty values
-        return {k: v for k, v in result.items() if v is not None and v != ''}
\ No newline at end of file
+    def top_k(self, n: int, by: str = 'citations') -> List[Paper]:
+        """Return the n papers with the largest values in column `by`, highest first"""
+        column = getattr(self, by)
+        indices = heapq.nlargest(n, range(len(column)), key=column.__getitem__)
+        return [self.papers[i] for i in indices]
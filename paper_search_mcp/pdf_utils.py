@@ -1,15 +1,33 @@
 """PDF text extraction utilities with pdftotext (poppler) support."""
 
+import functools
 import subprocess
 import shutil
 from typing import Optional
 
+try:
+    # Python bindings to libpoppler: same engine as the CLI, without a process per PDF
+    import pdftotext as poppler
+except ImportError:
+    poppler = None
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+try:
+    from pypdf import PdfReader
+except ImportError:
+    from PyPDF2 import PdfReader
+
 
 def extract_text_from_pdf(pdf_path: str) -> str:
     """Extract text from a PDF file.
 
     Uses pdftotext (poppler) for best quality extraction of academic papers,
-    with fallback to PyPDF2 if pdftotext is not available.
+    with fallback to pypdfium2 (if installed) or PyPDF2 if pdftotext is not
+    available.
 
     Args:
         pdf_path: Path to the PDF file
@@ -22,46 +40,84 @@ def extract_text_from_pdf(pdf_path: str) -> str:
     if text is not None:
         return text
 
+    # Fallback to PDFium, which is much faster than pure-Python parsing
+    if pdfium is not None:
+        text = _extract_with_pdfium(pdf_path)
+        if text is not None:
+            return text
+
     # Fallback to PyPDF2
     return _extract_with_pypdf(pdf_path)
 
 
+@functools.cache
+def _pdftotext_path() -> Optional[str]:
+    """Locate the pdftotext executable once per process."""
+    return shutil.which('pdftotext')
+
+
 def _extract_with_pdftotext(pdf_path: str) -> Optional[str]:
     """Extract text using pdftotext (poppler).
 
-    Returns None if pdftotext is not available.
+    Runs in-process when the pdftotext bindings are installed, otherwise
+    spawns the command-line tool. Returns None if neither is available.
     """
-    if not shutil.which('pdftotext'):
+    if poppler is not None:
+        try:
+            with open(pdf_path, 'rb') as f:
+                # physical=True matches the CLI's -layout mode
+                return '\n\n'.join(poppler.PDF(f, physical=True)).strip()
+        except (OSError, poppler.Error):
+            pass
+
+    pdftotext_path = _pdftotext_path()
+    if not pdftotext_path:
         return None
 
     try:
         # -layout preserves the original physical layout
         # -enc UTF-8 ensures proper encoding
-        result = subprocess.run(
-            ['pdftotext', '-layout', '-enc', 'UTF-8', pdf_path, '-'],
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
+        # Output is read as raw bytes and decoded once, after trimming
+        with subprocess.Popen(
+            [pdftotext_path, '-layout', '-enc', 'UTF-8', pdf_path, '-'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            # Python's own descriptors are non-inheritable already; skipping
+            # the close loop lets the child be spawned with posix_spawn/vfork
+            close_fds=False
+        ) as proc:
+            try:
+                output, _ = proc.communicate(timeout=60)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                raise
+        if proc.returncode == 0:
+            return output.strip().decode('utf-8', 'replace')
         return None
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError):
+    except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError):
         return None
 
 
-def _extract_with_pypdf(pdf_path: str) -> str:
-    """Extract text using PyPDF2 as fallback."""
+def _extract_with_pdfium(pdf_path: str) -> Optional[str]:
+    """Extract text using pypdfium2 (PDFium).
+
+    Returns None if the document cannot be opened or read.
+    """
     try:
-        from pypdf import PdfReader
-    except ImportError:
-        from PyPDF2 import PdfReader
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            return '\n'.join(page.get_textpage().get_text_range() for page in pdf).strip()
+        finally:
+            pdf.close()
+    except Exception:
+        return None
 
+
+def _extract_with_pypdf(pdf_path: str) -> str:
+    """Extract text using PyPDF2 as fallback."""
     try:
         reader = PdfReader(pdf_path)
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text() + "\n"
-        return text.strip()
+        # Join once instead of growing a string page by page
+        return "\n".join(page.extract_text() for page in reader.pages).strip()
     except Exception as e:
         return f"Error extracting text: {e}"
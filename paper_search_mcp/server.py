@@ -1,6 +1,9 @@
 # paper_search_mcp/server.py
-from typing import List, Dict, Optional
-import httpx
+from typing import Any, Callable, List, Dict, Optional
+from collections import OrderedDict
+import asyncio
+import time
+from operator import methodcaller
 from mcp.server.fastmcp import FastMCP
 from .academic_platforms.arxiv import ArxivSearcher
 from .academic_platforms.pubmed import PubMedSearcher
@@ -31,17 +34,59 @@ openalex_searcher = OpenAlexSearcher()
 # scihub_searcher = SciHubSearcher()
 
 
+async def _run(searcher_fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking searcher call in a worker thread so the event loop stays free"""
+    return await asyncio.to_thread(searcher_fn, *args, **kwargs)
+
+
+# Repeated identical lookups within the TTL are answered from memory
+RESULT_CACHE_SIZE = 512
+RESULT_CACHE_TTL = 300  # seconds
+_result_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+# How long get_paper_by_doi waits on OpenAlex before also querying CrossRef
+DOI_FALLBACK_DELAY = 0.5  # seconds
+
+
+async def _run_cached(searcher_fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Like _run, but reuse the result of an identical call made within RESULT_CACHE_TTL.
+
+    Empty results are not cached since searchers also return them on errors.
+    Lists are stored as tuples so cached results can't be modified by callers.
+    """
+    key = (searcher_fn, args, tuple(sorted(kwargs.items())))
+    now = time.monotonic()
+    entry = _result_cache.get(key)
+    if entry is not None and now - entry[0] < RESULT_CACHE_TTL:
+        _result_cache.move_to_end(key)
+        return entry[1]
+
+    result = await _run(searcher_fn, *args, **kwargs)
+    if result:
+        if isinstance(result, list):
+            result = tuple(result)
+        _result_cache[key] = (now, result)
+        _result_cache.move_to_end(key)
+        if len(_result_cache) > RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+    return result
+
+
+def _serialize(papers: List[Paper], abstract_limit: int) -> List[Dict]:
+    """Convert papers to dicts, letting map() drive the loop in C"""
+    return list(map(methodcaller('to_dict', abstract_limit=abstract_limit), papers))
+
+
 # Asynchronous helper to adapt synchronous searchers
 async def async_search(
     searcher, query: str, max_results: int, abstract_limit: int = 200, **kwargs
 ) -> List[Dict]:
-    async with httpx.AsyncClient() as client:
-        # Assuming searchers use requests internally; we'll call synchronously for now
-        if 'year' in kwargs:
-            papers = searcher.search(query, year=kwargs['year'], max_results=max_results)
-        else:
-            papers = searcher.search(query, max_results=max_results)
-        return [paper.to_dict(abstract_limit=abstract_limit) for paper in papers]
+    # Searchers use requests sessions internally, so run them in a worker thread
+    if 'year' in kwargs:
+        papers = await _run(searcher.search, query, year=kwargs['year'], max_results=max_results)
+    else:
+        papers = await _run(searcher.search, query, max_results=max_results)
+    return _serialize(papers, abstract_limit)
 
 
 # Tool definitions
@@ -61,8 +106,8 @@ async def search_arxiv(
     Returns:
         List of paper metadata in dictionary format.
     """
-    papers = arxiv_searcher.search(query, max_results, date_from=date_from, date_to=date_to)
-    return [p.to_dict(abstract_limit=abstract_limit) for p in papers] if papers else []
+    papers = await _run_cached(arxiv_searcher.search, query, max_results, date_from=date_from, date_to=date_to)
+    return _serialize(papers, abstract_limit)
 
 
 @mcp.tool()
@@ -81,8 +126,8 @@ async def search_pubmed(
     Returns:
         List of paper metadata in dictionary format.
     """
-    papers = pubmed_searcher.search(query, max_results, date_from=date_from, date_to=date_to)
-    return [p.to_dict(abstract_limit=abstract_limit) for p in papers] if papers else []
+    papers = await _run_cached(pubmed_searcher.search, query, max_results, date_from=date_from, date_to=date_to)
+    return _serialize(papers, abstract_limit)
 
 
 @mcp.tool()
@@ -101,8 +146,8 @@ async def search_biorxiv(
     Returns:
         List of paper metadata in dictionary format.
     """
-    papers = biorxiv_searcher.search(query, max_results, date_from=date_from, date_to=date_to)
-    return [p.to_dict(abstract_limit=abstract_limit) for p in papers] if papers else []
+    papers = await _run_cached(biorxiv_searcher.search, query, max_results, date_from=date_from, date_to=date_to)
+    return _serialize(papers, abstract_limit)
 
 
 @mcp.tool()
@@ -121,8 +166,8 @@ async def search_medrxiv(
     Returns:
         List of paper metadata in dictionary format.
     """
-    papers = medrxiv_searcher.search(query, max_results, date_from=date_from, date_to=date_to)
-    return [p.to_dict(abstract_limit=abstract_limit) for p in papers] if papers else []
+    papers = await _run_cached(medrxiv_searcher.search, query, max_results, date_from=date_from, date_to=date_to)
+    return _serialize(papers, abstract_limit)
 
 
 @mcp.tool()
@@ -141,8 +186,8 @@ async def search_google_scholar(
     Returns:
         List of paper metadata in dictionary format.
     """
-    papers = google_scholar_searcher.search(query, max_results, date_from=date_from, date_to=date_to)
-    return [p.to_dict(abstract_limit=abstract_limit) for p in papers] if papers else []
+    papers = await _run_cached(google_scholar_searcher.search, query, max_results, date_from=date_from, date_to=date_to)
+    return _serialize(papers, abstract_limit)
 
 
 @mcp.tool()
@@ -162,9 +207,8 @@ async def search_iacr(
     Returns:
         List of paper metadata in dictionary format.
     """
-    async with httpx.AsyncClient() as client:
-        papers = iacr_searcher.search(query, max_results, fetch_details, date_from=date_from, date_to=date_to)
-        return [paper.to_dict(abstract_limit=abstract_limit) for paper in papers] if papers else []
+    papers = await _run_cached(iacr_searcher.search, query, max_results, fetch_details, date_from=date_from, date_to=date_to)
+    return _serialize(papers, abstract_limit)
 
 
 # Unified download/read tools
@@ -178,6 +222,7 @@ SEARCHERS = {
     'crossref': crossref_searcher,
     'openalex': openalex_searcher,
 }
+_SUPPORTED_SOURCES_MSG = f"Supported: {', '.join(SEARCHERS)}"
 
 
 @mcp.tool()
@@ -191,11 +236,12 @@ async def download_paper(paper_id: str, source: str, save_path: str = "./downloa
     Returns:
         Path to the downloaded PDF file, or error message.
     """
-    searcher = SEARCHERS.get(source.lower())
+    # Sources are usually passed lowercase already; only normalize on a miss
+    searcher = SEARCHERS.get(source) or SEARCHERS.get(source.lower())
     if not searcher:
-        return f"Unknown source: {source}. Supported: {', '.join(SEARCHERS.keys())}"
+        return f"Unknown source: {source}. {_SUPPORTED_SOURCES_MSG}"
     try:
-        return searcher.download_pdf(paper_id, save_path)
+        return await _run(searcher.download_pdf, paper_id, save_path)
     except NotImplementedError as e:
         return str(e)
     except Exception as e:
@@ -213,11 +259,11 @@ async def read_paper(paper_id: str, source: str, save_path: str = "./downloads")
     Returns:
         str: The extracted text content of the paper, or error message.
     """
-    searcher = SEARCHERS.get(source.lower())
+    searcher = SEARCHERS.get(source) or SEARCHERS.get(source.lower())
     if not searcher:
-        return f"Unknown source: {source}. Supported: {', '.join(SEARCHERS.keys())}"
+        return f"Unknown source: {source}. {_SUPPORTED_SOURCES_MSG}"
     try:
-        return searcher.read_paper(paper_id, save_path)
+        return await _run(searcher.read_paper, paper_id, save_path)
     except NotImplementedError as e:
         return str(e)
     except Exception as e:
@@ -241,11 +287,12 @@ async def search_semantic(
     Returns:
         List of paper metadata in dictionary format.
     """
-    papers = semantic_searcher.search(
+    papers = await _run_cached(
+        semantic_searcher.search,
         query, year=year, max_results=max_results,
         date_from=date_from, date_to=date_to
     )
-    return [p.to_dict(abstract_limit=abstract_limit) for p in papers] if papers else []
+    return _serialize(papers, abstract_limit)
 
 
 @mcp.tool()
@@ -275,8 +322,8 @@ async def search_crossref(
         kwargs['sort'] = sort
     if order is not None:
         kwargs['order'] = order
-    papers = crossref_searcher.search(query, max_results, date_from=date_from, date_to=date_to, **kwargs)
-    return [p.to_dict(abstract_limit=abstract_limit) for p in papers] if papers else []
+    papers = await _run_cached(crossref_searcher.search, query, max_results, date_from=date_from, date_to=date_to, **kwargs)
+    return _serialize(papers, abstract_limit)
 
 
 @mcp.tool()
@@ -289,9 +336,8 @@ async def get_crossref_paper_by_doi(doi: str, abstract_limit: int = 200) -> Dict
     Returns:
         Paper metadata in dictionary format, or empty dict if not found.
     """
-    async with httpx.AsyncClient() as client:
-        paper = crossref_searcher.get_paper_by_doi(doi)
-        return paper.to_dict(abstract_limit=abstract_limit) if paper else {}
+    paper = await _run_cached(crossref_searcher.get_paper_by_doi, doi)
+    return paper.to_dict(abstract_limit=abstract_limit) if paper else {}
 
 
 @mcp.tool()
@@ -313,8 +359,8 @@ async def search_openalex(
     Returns:
         List of paper metadata in dictionary format. Open access papers include 'pdf' field.
     """
-    papers = openalex_searcher.search(query, max_results, date_from=date_from, date_to=date_to)
-    return [p.to_dict(abstract_limit=abstract_limit) for p in papers] if papers else []
+    papers = await _run_cached(openalex_searcher.search, query, max_results, date_from=date_from, date_to=date_to)
+    return _serialize(papers, abstract_limit)
 
 
 @mcp.tool()
@@ -327,7 +373,7 @@ async def get_openalex_work_by_id(openalex_id: str, abstract_limit: int = 200) -
     Returns:
         Paper metadata in dictionary format, or empty dict if not found.
     """
-    paper = openalex_searcher.get_work_by_id(openalex_id)
+    paper = await _run_cached(openalex_searcher.get_work_by_id, openalex_id)
     return paper.to_dict(abstract_limit=abstract_limit) if paper else {}
 
 
@@ -344,8 +390,8 @@ async def get_openalex_references(
     Returns:
         List of paper metadata for works cited by this paper.
     """
-    papers = openalex_searcher.get_references(paper_id, max_results)
-    return [p.to_dict(abstract_limit=abstract_limit) for p in papers] if papers else []
+    papers = await _run_cached(openalex_searcher.get_references, paper_id, max_results)
+    return _serialize(papers, abstract_limit)
 
 
 @mcp.tool()
@@ -361,8 +407,8 @@ async def get_openalex_citations(
     Returns:
         List of paper metadata for works that cite this paper.
     """
-    papers = openalex_searcher.get_citing_papers(paper_id, max_results)
-    return [p.to_dict(abstract_limit=abstract_limit) for p in papers] if papers else []
+    papers = await _run_cached(openalex_searcher.get_citing_papers, paper_id, max_results)
+    return _serialize(papers, abstract_limit)
 
 
 @mcp.tool()
@@ -375,13 +421,21 @@ async def get_paper_by_doi(doi: str, abstract_limit: int = 200) -> Dict:
     Returns:
         Paper metadata in dictionary format, or empty dict if not found.
     """
-    # Try OpenAlex first (has citations, categories)
-    paper = openalex_searcher.get_work_by_doi(doi)
+    # Prefer OpenAlex (has citations, categories). Cached and fast hits return
+    # before CrossRef is asked; a slow OpenAlex gets CrossRef started alongside
+    openalex_task = asyncio.create_task(_run_cached(openalex_searcher.get_work_by_doi, doi))
+    await asyncio.wait({openalex_task}, timeout=DOI_FALLBACK_DELAY)
+    if openalex_task.done() and openalex_task.result():
+        return openalex_task.result().to_dict(abstract_limit=abstract_limit)
+
+    crossref_task = asyncio.create_task(_run_cached(crossref_searcher.get_paper_by_doi, doi))
+    paper = await openalex_task
     if paper:
+        crossref_task.cancel()
         return paper.to_dict(abstract_limit=abstract_limit)
 
     # Fallback to CrossRef
-    paper = crossref_searcher.get_paper_by_doi(doi)
+    paper = await crossref_task
     if paper:
         return paper.to_dict(abstract_limit=abstract_limit)
 
@@ -398,7 +452,7 @@ async def search_authors(name: str, max_results: int = 10) -> List[Dict]:
     Returns:
         List of author metadata with id, name, works_count, citations, affiliations.
     """
-    return openalex_searcher.search_authors(name, max_results)
+    return list(await _run_cached(openalex_searcher.search_authors, name, max_results))
 
 
 @mcp.tool()
@@ -417,8 +471,8 @@ async def get_author_papers(
     Returns:
         List of paper metadata sorted by citations (highest first).
     """
-    papers = openalex_searcher.get_author_papers(author_id, max_results, date_from, date_to)
-    return [p.to_dict(abstract_limit=abstract_limit) for p in papers] if papers else []
+    papers = await _run_cached(openalex_searcher.get_author_papers, author_id, max_results, date_from, date_to)
+    return _serialize(papers, abstract_limit)
 
 
 def main():
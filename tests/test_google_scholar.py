@@ -1,7 +1,10 @@
 import unittest
 import os
+import time
+from unittest import mock
 import requests
 from paper_search_mcp.academic_platforms.google_scholar import GoogleScholarSearcher
+from paper_search_mcp.paper import dedupe_papers
 
 def check_scholar_accessible():
     """检查 Google Scholar 是否可访问"""
@@ -42,5 +45,79 @@ class TestGoogleScholarSearcher(unittest.TestCase):
         message = self.searcher.read_paper("some_id")
         self.assertIn("Google Scholar doesn't support direct paper reading", message)
 
+
+SAMPLE_PAGE = """<html><body><div id="gs_res">
+<div class="gs_r gs_or"><div class="gs_ri">
+  <h3 class="gs_rt"><span>[PDF]</span> <a href="https://example.org/a.pdf">Deep Learning</a></h3>
+  <div class="gs_a">Y LeCun, Y Bengio , G Hinton - Nature, 2015 - nature.com</div>
+  <div class="gs_rs">Deep learning allows computational models...</div>
+  <div class="gs_fl"><a href="/scholar?cites=5362332738201102290">Cited by 75000</a><a href="/scholar?cluster=111">All 20 versions</a></div>
+</div></div>
+<div class="gs_r gs_or"><div class="gs_ri" data-cid="AbCdEf123">
+  <h3 class="gs_rt"><a href="https://example.org/b">Second result</a></h3>
+  <div class="gs_a">A Author - Journal, 1999</div>
+  <div class="gs_fl"><a href="/scholar?q=related:x">Related articles</a></div>
+</div></div>
+</div></body></html>"""
+
+
+class TestGoogleScholarParsing(unittest.TestCase):
+    def setUp(self):
+        self.searcher = GoogleScholarSearcher()
+
+    def test_parse_page_fields(self):
+        first, second = self.searcher._parse_page(SAMPLE_PAGE)
+        self.assertEqual(first.paper_id, '5362332738201102290')
+        self.assertEqual(first.title, 'Deep Learning')
+        self.assertEqual(first.url, 'https://example.org/a.pdf')
+        self.assertEqual(first.authors, ['Y LeCun', 'Y Bengio', 'G Hinton'])
+        self.assertEqual(first.published_date.year, 2015)
+        self.assertEqual(first.citations, 75000)
+        self.assertEqual(first.abstract, 'Deep learning allows computational models...')
+
+    def test_parse_page_falls_back_to_data_cid(self):
+        _, second = self.searcher._parse_page(SAMPLE_PAGE)
+        self.assertEqual(second.paper_id, 'AbCdEf123')
+        self.assertEqual(second.citations, 0)
+        self.assertEqual(second.abstract, '')
+
+    def test_extract_year_prefers_last_match(self):
+        info = "A Smith - Nature 521 (7553), 1987-1999, 2015 - nature.com"
+        self.assertEqual(self.searcher._extract_year(info), 2015)
+        self.assertEqual(self.searcher._extract_year("A Smith - Journal, 2015 - 2099.org"), 2015)
+        self.assertIsNone(self.searcher._extract_year("A Smith - Journal - x.org"))
+
+    def test_linkless_results_keep_distinct_ids(self):
+        citation = """<div class="gs_r"><div class="gs_ri">
+          <h3 class="gs_rt"><span>[CITATION]</span> {title}</h3>
+          <div class="gs_a">{author} - 2001</div>
+          <div class="gs_fl"><a href="/scholar?q=related:x">Related articles</a></div>
+        </div></div>"""
+        html = '<html><body>' + citation.format(title='First', author='A One') + citation.format(title='Second', author='B Two') + '</body></html>'
+        papers = self.searcher._parse_page(html)
+        self.assertEqual(len(dedupe_papers(papers)), 2)
+        self.assertNotEqual(papers[0].paper_id, papers[1].paper_id)
+        self.assertTrue(papers[0].paper_id.startswith('gs_'))
+
+    def test_concurrent_requests_are_spaced(self):
+        self.searcher.MIN_REQUEST_DELAY = self.searcher.MAX_REQUEST_DELAY = 0.05
+        starts = []
+
+        def fake_get(url, params):
+            starts.append(time.monotonic())
+            return mock.Mock(status_code=200, text=SAMPLE_PAGE)
+
+        with mock.patch.object(self.searcher.session, 'get', side_effect=fake_get):
+            papers = self.searcher.search("q", max_results=30)
+
+        self.assertEqual(len(papers), 2)  # same two results on every page, deduplicated
+        gaps = [b - a for a, b in zip(sorted(starts), sorted(starts)[1:])]
+        self.assertEqual(len(starts), 3)
+        self.assertTrue(all(gap >= 0.04 for gap in gaps), gaps)
+
+    def test_parse_page_without_results(self):
+        self.assertIsNone(self.searcher._parse_page('<html><body></body></html>'))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,190 @@
+# tests/test_openalex.py
+import io
+import os
+import stat
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+import requests
+from paper_search_mcp.academic_platforms import openalex
+from paper_search_mcp.academic_platforms.openalex import OpenAlexSearcher
+from paper_search_mcp.paper import Paper
+
+
+def make_response(chunks=(), status_error=None, stream_error=None):
+    response = mock.MagicMock()
+    response.__enter__.return_value = response
+    if status_error:
+        response.raise_for_status.side_effect = status_error
+
+    def iter_content(chunk_size):
+        yield from chunks
+        if stream_error:
+            raise stream_error
+
+    response.iter_content.side_effect = iter_content
+    return response
+
+
+WORK = {
+    'id': 'https://openalex.org/W2741809807',
+    'doi': 'https://doi.org/10.7717/peerj.4375',
+    'title': 'The state of OA',
+    'authorships': [{'author': {'display_name': 'Heather Piwowar'}}, {'author': {}}],
+    'abstract_inverted_index': {'Despite': [0], 'growing': [1], 'interest': [2, 4], 'in': [3]},
+    'publication_date': '2018-02-13',
+    'open_access': {'is_oa': True, 'oa_url': 'https://peerj.com/articles/4375.pdf'},
+    'primary_location': {'pdf_url': 'https://example.org/other.pdf'},
+    'type': 'article',
+    'cited_by_count': 42,
+    'topics': [{'display_name': f'Topic {i}'} for i in range(5)],
+}
+
+LIST_BODY = b'{"meta": {"count": 2}, "results": [{"id": "https://openalex.org/W1", "title": "One", "cited_by_count": 1.5}, {"id": "https://openalex.org/W2", "title": "Two"}]}'
+
+
+class TestOpenAlexParsing(unittest.TestCase):
+    def setUp(self):
+        self.searcher = OpenAlexSearcher()
+
+    def test_parse_work_fields(self):
+        paper = self.searcher._parse_work(WORK)
+
+        self.assertEqual(paper.paper_id, 'W2741809807')
+        self.assertEqual(paper.doi, '10.7717/peerj.4375')
+        self.assertEqual(paper.authors, ['Heather Piwowar'])
+        self.assertEqual(paper.published_date, datetime(2018, 2, 13))
+        self.assertEqual(paper.pdf_url, 'https://peerj.com/articles/4375.pdf')
+        self.assertEqual(paper.categories, ['Topic 0', 'Topic 1', 'Topic 2'])
+        self.assertEqual(paper.citations, 42)
+        self.assertEqual(paper.abstract, 'Despite growing interest in interest')
+
+    def test_parse_work_tolerates_null_sub_objects(self):
+        work = dict(WORK, authorships=None, open_access=None, topics=None, abstract_inverted_index=None)
+        paper = self.searcher._parse_work(work)
+
+        self.assertEqual(paper.authors, [])
+        self.assertEqual(paper.pdf_url, 'https://example.org/other.pdf')
+        self.assertEqual(paper.categories, ['article'])
+        self.assertEqual(paper.abstract, '')
+
+    def test_parse_work_falls_back_to_year_for_partial_dates(self):
+        for value, expected in [('2018', datetime(2018, 1, 1)), ('2018-13-40', datetime(2018, 1, 1)), ('n.d.', None)]:
+            with self.subTest(value=value):
+                paper = self.searcher._parse_work(dict(WORK, publication_date=value))
+                self.assertEqual(paper.published_date, expected)
+
+    def test_reconstruct_abstract_skips_missing_positions(self):
+        self.assertEqual(self.searcher._reconstruct_abstract({'b': [2], 'a': [0]}), 'a b')
+        self.assertEqual(self.searcher._reconstruct_abstract({}), '')
+        self.assertEqual(self.searcher._reconstruct_abstract({'a': []}), '')
+
+    def test_get_references_uses_single_cited_by_query(self):
+        with mock.patch.object(self.searcher, '_iter_works', return_value=iter([WORK])) as iter_works:
+            papers = self.searcher.get_references('2741809807', max_results=5)
+
+        iter_works.assert_called_once()
+        params = iter_works.call_args.args[0]
+        self.assertEqual(params['filter'], 'cited_by:W2741809807')
+        self.assertEqual(params['per_page'], 5)
+        self.assertEqual([p.paper_id for p in papers], ['W2741809807'])
+
+
+class TestOpenAlexIterWorks(unittest.TestCase):
+    def iter_works(self, searcher):
+        response = mock.MagicMock(content=LIST_BODY, raw=io.BytesIO(LIST_BODY))
+        response.__enter__.return_value = response
+        with mock.patch.object(searcher.session, 'get', return_value=response) as get:
+            works = list(searcher._iter_works({'filter': 'x'}))
+        return works, get.call_args.kwargs['stream']
+
+    def test_decodes_whole_body_by_default(self):
+        works, stream = self.iter_works(OpenAlexSearcher())
+        self.assertFalse(stream)
+        self.assertEqual([w['title'] for w in works], ['One', 'Two'])
+        self.assertEqual(works[0]['cited_by_count'], 1.5)
+
+    @unittest.skipIf(openalex.ijson is None, "ijson not installed")
+    def test_streams_with_ijson_when_requested(self):
+        works, stream = self.iter_works(OpenAlexSearcher(stream_results=True))
+        self.assertTrue(stream)
+        self.assertEqual([w['title'] for w in works], ['One', 'Two'])
+        self.assertIsInstance(works[0]['cited_by_count'], float)
+
+    def test_stream_request_ignored_without_ijson(self):
+        with mock.patch.object(openalex, 'ijson', None):
+            self.assertFalse(OpenAlexSearcher(stream_results=True).stream_results)
+
+
+class TestOpenAlexDownload(unittest.TestCase):
+    def setUp(self):
+        self.searcher = OpenAlexSearcher()
+        self.paper = Paper(
+            paper_id='W1', title='A Paper', authors=[], abstract='', doi='',
+            published_date=None, pdf_url='https://example.org/w1.pdf',
+            url='https://openalex.org/W1', source='openalex',
+        )
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.save_path = tmp_dir.name
+
+    def download(self, response):
+        with mock.patch.object(self.searcher, 'get_work_by_id', return_value=self.paper), \
+                mock.patch.object(self.searcher.session, 'get', return_value=response):
+            return self.searcher.download_pdf('W1', self.save_path)
+
+    def test_download_writes_pdf_with_umask_permissions(self):
+        path = self.download(make_response([b'%PDF-', b'1.7']))
+
+        self.assertEqual(path, f'{self.save_path}/W1.pdf')
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(), b'%PDF-1.7')
+        self.assertEqual(os.listdir(self.save_path), ['W1.pdf'])
+
+        umask = os.umask(0)
+        os.umask(umask)
+        self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o666 & ~umask)
+
+    def test_http_error_leaves_no_partial_file(self):
+        response = make_response(status_error=requests.HTTPError('404'))
+        with self.assertRaises(requests.HTTPError):
+            self.download(response)
+        self.assertEqual(os.listdir(self.save_path), [])
+
+    def test_interrupted_stream_leaves_no_partial_file(self):
+        response = make_response([b'%PDF-'], stream_error=requests.ConnectionError('reset'))
+        with self.assertRaises(requests.ConnectionError):
+            self.download(response)
+        self.assertEqual(os.listdir(self.save_path), [])
+
+
+class TestOpenAlexWorkCache(unittest.TestCase):
+    def setUp(self):
+        self.searcher = OpenAlexSearcher()
+
+    def lookup(self, status_code, monotonic=0.0, calls=2):
+        response = mock.MagicMock(status_code=status_code, content=b'{"id": "https://openalex.org/W1", "title": "A Paper"}')
+        with mock.patch.object(self.searcher.session, 'get', return_value=response) as get, \
+                mock.patch('paper_search_mcp.academic_platforms.openalex.time.monotonic', return_value=monotonic):
+            papers = [self.searcher.get_work_by_id('W1') for _ in range(calls)]
+        return papers, get
+
+    def test_found_work_is_reused(self):
+        papers, get = self.lookup(200)
+        self.assertEqual([p.title for p in papers], ['A Paper', 'A Paper'])
+        self.assertEqual(get.call_count, 1)
+
+    def test_missing_work_is_not_cached(self):
+        papers, get = self.lookup(404)
+        self.assertEqual(papers, [None, None])
+        self.assertEqual(get.call_count, 2)
+
+    def test_cached_work_expires_after_ttl(self):
+        self.lookup(200, calls=1)
+        _, get = self.lookup(200, monotonic=self.searcher.WORK_CACHE_TTL, calls=1)
+        self.assertEqual(get.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
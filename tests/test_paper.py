@@ -0,0 +1,116 @@
+# tests/test_paper.py
+import dataclasses
+import json
+import unittest
+from datetime import date, datetime
+from paper_search_mcp.paper import Paper, PaperBatch, dedupe_papers
+
+
+def make_paper(**kwargs):
+    fields = dict(
+        paper_id='W1',
+        title='A Paper',
+        authors=['Ada Lovelace'],
+        abstract='An abstract.',
+        doi='10.1000/xyz',
+        published_date=datetime(2020, 5, 6),
+        pdf_url='',
+        url='https://example.org/W1',
+        source='openalex',
+    )
+    fields.update(kwargs)
+    return Paper(**fields)
+
+
+class TestPaper(unittest.TestCase):
+    def test_to_dict_truncates_abstract(self):
+        paper = make_paper(abstract='x' * 300)
+        result = paper.to_dict(abstract_limit=200)
+        self.assertEqual(result['abstract'], 'x' * 200 + '...')
+        self.assertEqual(paper.to_dict(abstract_limit=-1)['abstract'], 'x' * 300)
+
+    def test_to_dict_omits_empty_fields(self):
+        result = make_paper(pdf_url='', doi='').to_dict()
+        self.assertNotIn('pdf', result)
+        self.assertNotIn('doi', result)
+        self.assertEqual(result['date'], '2020-05-06')
+
+    def test_to_dict_accepts_date_and_string_dates(self):
+        self.assertEqual(make_paper(published_date=date(2021, 2, 3)).to_dict()['date'], '2021-02-03')
+        self.assertEqual(make_paper(published_date='2021-02').to_dict()['date'], '2021-02')
+
+    def test_abstract_loader_runs_once_on_access(self):
+        calls = []
+        paper = make_paper(abstract=None, abstract_loader=lambda: calls.append(1) or 'Deferred text')
+        self.assertEqual(calls, [])
+        self.assertEqual(paper.abstract, 'Deferred text')
+        self.assertEqual(paper.abstract, 'Deferred text')
+        self.assertEqual(calls, [1])
+
+    def test_asdict_exposes_loaded_abstract_only(self):
+        paper = make_paper(abstract=None, abstract_loader=lambda: 'Deferred text')
+        result = dataclasses.asdict(paper)
+        self.assertEqual(result['abstract'], 'Deferred text')
+        self.assertNotIn('abstract_loader', result)
+        self.assertNotIn('__dict__', dir(paper))
+
+    def test_to_dict_without_abstract_skips_loader(self):
+        calls = []
+        paper = make_paper(abstract=None, abstract_loader=lambda: calls.append(1) or 'Deferred text')
+        result = paper.to_dict(abstract_limit=0)
+        self.assertNotIn('abstract', result)
+        self.assertEqual(calls, [])
+
+    def test_to_dict_reflects_field_changes(self):
+        paper = make_paper(abstract='Old')
+        paper.to_dict()
+        paper.title = 'New'
+        paper.citations = 7
+        paper.published_date = datetime(2024, 1, 2)
+        paper.abstract = 'Short'
+        result = paper.to_dict()
+        self.assertEqual(result['title'], 'New')
+        self.assertEqual(result['citations'], 7)
+        self.assertEqual(result['date'], '2024-01-02')
+        self.assertEqual(result['abstract'], 'Short')
+
+    def test_to_json_bytes_matches_to_dict(self):
+        paper = make_paper(title='Café')
+        self.assertEqual(json.loads(paper.to_json_bytes()), paper.to_dict())
+
+    def test_paper_has_no_instance_dict(self):
+        paper = make_paper()
+        self.assertFalse(hasattr(paper, '__dict__'))
+        with self.assertRaises(AttributeError):
+            paper.unknown_field = 1
+
+
+class TestPaperBatch(unittest.TestCase):
+    def test_columns_follow_paper_order(self):
+        papers = [make_paper(paper_id='a', doi='10.1/a', citations=3), make_paper(paper_id='b', doi='', citations=None)]
+        batch = PaperBatch.from_papers(papers)
+        self.assertEqual(len(batch), 2)
+        self.assertEqual(batch.dois, ['10.1/a', ''])
+        self.assertEqual(list(batch.citations), [3, 0])
+
+    def test_top_k_by_citations(self):
+        papers = [make_paper(paper_id=str(i), citations=c) for i, c in enumerate([5, 50, 1, 20])]
+        top = PaperBatch.from_papers(papers).top_k(2)
+        self.assertEqual([p.paper_id for p in top], ['1', '3'])
+
+
+class TestDedupePapers(unittest.TestCase):
+    def test_matches_on_doi_then_source_id(self):
+        papers = [
+            make_paper(paper_id='a', doi='10.1/X'),
+            make_paper(paper_id='b', doi='10.1/x'),
+            make_paper(paper_id='c', doi=''),
+            make_paper(paper_id='c', doi=''),
+            make_paper(paper_id='c', doi='', source='arxiv'),
+        ]
+        unique = dedupe_papers(papers)
+        self.assertEqual([(p.paper_id, p.source) for p in unique], [('a', 'openalex'), ('c', 'openalex'), ('c', 'arxiv')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,10 @@
 import unittest
 import asyncio
 import os
+import time
+from unittest import mock
 from paper_search_mcp import server
+from paper_search_mcp.paper import Paper
 
 class TestPaperSearchServer(unittest.TestCase):
     def test_search_arxiv(self):
@@ -32,5 +35,62 @@ class TestPaperSearchServer(unittest.TestCase):
             self.assertTrue(result.endswith(".pdf"), f"Result for {paper_id} should be a PDF file path")
             self.assertTrue(os.path.exists(result), f"PDF file for {paper_id} should exist on disk")
 
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        server._result_cache.clear()
+        self.calls = []
+
+    def fake_search(self, query, max_results=10):
+        self.calls.append(query)
+        return [query] * max_results if query else []
+
+    def test_repeated_call_is_served_from_cache(self):
+        first = asyncio.run(server._run_cached(self.fake_search, "ml", max_results=2))
+        second = asyncio.run(server._run_cached(self.fake_search, "ml", max_results=2))
+        self.assertEqual(first, ("ml", "ml"))
+        self.assertIs(first, second)
+        self.assertEqual(self.calls, ["ml"])
+
+    def test_empty_results_are_not_cached(self):
+        asyncio.run(server._run_cached(self.fake_search, ""))
+        asyncio.run(server._run_cached(self.fake_search, ""))
+        self.assertEqual(self.calls, ["", ""])
+
+
+class TestGetPaperByDoi(unittest.TestCase):
+    def setUp(self):
+        server._result_cache.clear()
+        self.paper = Paper(
+            paper_id='W1', title='A Paper', authors=[], abstract='', doi='10.1000/xyz',
+            published_date=None, pdf_url='', url='', source='openalex',
+        )
+
+    def lookup(self, openalex_result, openalex_delay=0.0):
+        def get_work_by_doi(doi):
+            time.sleep(openalex_delay)
+            return openalex_result
+
+        with mock.patch.object(server.openalex_searcher, 'get_work_by_doi', side_effect=get_work_by_doi), \
+                mock.patch.object(server.crossref_searcher, 'get_paper_by_doi', return_value=self.paper) as crossref, \
+                mock.patch.object(server, 'DOI_FALLBACK_DELAY', 0.05):
+            result = asyncio.run(server.get_paper_by_doi('10.1000/xyz'))
+        return result, crossref
+
+    def test_openalex_hit_skips_crossref(self):
+        result, crossref = self.lookup(self.paper)
+        self.assertEqual(result['id'], 'W1')
+        crossref.assert_not_called()
+
+    def test_openalex_miss_falls_back_to_crossref(self):
+        result, crossref = self.lookup(None)
+        self.assertEqual(result['id'], 'W1')
+        crossref.assert_called_once_with('10.1000/xyz')
+
+    def test_slow_openalex_starts_crossref_alongside(self):
+        result, crossref = self.lookup(self.paper, openalex_delay=0.2)
+        self.assertEqual(result['source'], 'openalex')
+        crossref.assert_called_once_with('10.1000/xyz')
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file